@@ -0,0 +1,86 @@
+from database import get_db_connection
+from tmdb_cache import cached_get
+from dotenv import load_dotenv
+import os
+import queue
+import threading
+import tmdb
+
+# Background worker that warms the TMDB cache for movies a user just saved,
+# so the follow-up /watchlist, /recommendations and providers reads are served warm.
+
+load_dotenv()
+TMDB_API_KEY = os.getenv("TMDB_API_KEY")
+TMDB_BASE_URL = "https://api.themoviedb.org/3"
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "2"))
+PREFETCH_QUEUE_SIZE = int(os.getenv("PREFETCH_QUEUE_SIZE", "256"))
+
+_queue = queue.Queue(maxsize=PREFETCH_QUEUE_SIZE)
+_pending = set()  # (user_id, movie_id) events queued or in progress
+_lock = threading.Lock()
+_workers = []
+
+def publish_movie_touched(user_id: int, movie_id: int):
+    """Queue a "movie touched" event without ever blocking the caller.
+
+    Duplicate events are collapsed and events are dropped when the queue is full,
+    since prefetching is only an optimization.
+    """
+    key = (user_id, movie_id)
+    with _lock:
+        if key in _pending:
+            return
+        _start_workers()
+        try:
+            _queue.put_nowait(key)
+        except queue.Full:
+            return
+        _pending.add(key)
+
+def _start_workers():
+    """Lazily start the worker pool on the first published event (caller holds _lock)."""
+    if _workers:
+        return
+    for i in range(PREFETCH_WORKERS):
+        worker = threading.Thread(target=_worker, name=f"prefetch-{i}", daemon=True)
+        worker.start()
+        _workers.append(worker)
+
+def _worker():
+    while True:
+        user_id, movie_id = _queue.get()
+        try:
+            _warm_movie(user_id, movie_id)
+        except Exception as e:
+            print(f"Prefetch failed for movie {movie_id}: {e}")
+        finally:
+            with _lock:
+                _pending.discard((user_id, movie_id))
+            _queue.task_done()
+
+def _warm_movie(user_id: int, movie_id: int):
+    # Step 1: Movie details, providers and recommendation candidates
+    details = tmdb.get_movie_details(movie_id)
+    tmdb.get_movie_providers(movie_id)
+    tmdb.get_movie_recommendations(movie_id)
+
+    # Step 2: Details for the rest of the user's movies, used by /watchlist and /recommendations
+    db = get_db_connection()
+    if db:
+        try:
+            cursor = db.cursor()
+            cursor.execute("""
+                SELECT movie_id FROM watched WHERE user_id = %s
+                UNION
+                SELECT movie_id FROM watchlist WHERE user_id = %s
+            """, (user_id, user_id))
+            for (user_movie_id,) in cursor.fetchall():
+                cached_get(f"{TMDB_BASE_URL}/movie/{user_movie_id}?api_key={TMDB_API_KEY}")
+        finally:
+            db.close()
+
+    # Step 3: Discover results for this movie's genres, used by /recommendations
+    genre_mapping = {g["name"]: g["id"] for g in tmdb.get_movie_genres()["genres"]}
+    for genre in details["genres"]:
+        if genre in genre_mapping:
+            cached_get(f"{TMDB_BASE_URL}/discover/movie?api_key={TMDB_API_KEY}&with_genres={genre_mapping[genre]}")
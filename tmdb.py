@@ -3,6 +3,7 @@ import requests
 import os
 from dotenv import load_dotenv
 import json
+from tmdb_cache import cached_get
 
 # Load API key from .env
 load_dotenv()
@@ -20,7 +21,7 @@ router = APIRouter()
 @router.get("/tmdb/movie/{movie_id}")
 def get_movie_details(movie_id: int):
     url = f"https://api.themoviedb.org/3/movie/{movie_id}?api_key={TMDB_API_KEY}"
-    response = requests.get(url)
+    response = cached_get(url)
 
     if response.status_code != 200:
         raise HTTPException(status_code=response.status_code, detail="Movie not found")
@@ -49,7 +50,7 @@ def get_movie_details(movie_id: int):
 @router.get("/tmdb/genres")
 def get_movie_genres():
     url = f"https://api.themoviedb.org/3/genre/movie/list?api_key={TMDB_API_KEY}"
-    response = requests.get(url)
+    response = cached_get(url)
     
     if response.status_code != 200:
         raise HTTPException(status_code=response.status_code, detail="Genres not found")
@@ -84,7 +85,7 @@ def search_movies(query: str):
 @router.get("/tmdb/movie/{movie_id}/providers")
 def get_movie_providers(movie_id: int):
     url = f"https://api.themoviedb.org/3/movie/{movie_id}/watch/providers?api_key={TMDB_API_KEY}"
-    response = requests.get(url)
+    response = cached_get(url)
 
     if response.status_code != 200:
         return {"error": "Failed to fetch data from TMDB"}
@@ -113,7 +114,7 @@ def get_movie_providers(movie_id: int):
 @router.get("/tmdb/movie/{movie_id}/recommendations")
 def get_movie_recommendations(movie_id: int):
     url = f"https://api.themoviedb.org/3/movie/{movie_id}/recommendations?api_key={TMDB_API_KEY}"
-    response = requests.get(url)
+    response = cached_get(url)
 
     if response.status_code != 200:
         raise HTTPException(status_code=response.status_code, detail="Recommendations not found")
@@ -0,0 +1,34 @@
+from collections import OrderedDict
+from dotenv import load_dotenv
+import os
+import threading
+import time
+import requests
+
+load_dotenv()
+TMDB_CACHE_TTL = int(os.getenv("TMDB_CACHE_TTL", "600"))  # Seconds a TMDB response stays fresh
+TMDB_CACHE_SIZE = int(os.getenv("TMDB_CACHE_SIZE", "2048"))  # Max number of cached URLs
+
+_cache = OrderedDict()  # url -> (expires_at, response)
+_lock = threading.Lock()
+
+def cached_get(url: str):
+    """GET a TMDB url, serving successful responses from an in-process LRU cache."""
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(url)
+        if entry and entry[0] > now:
+            _cache.move_to_end(url)
+            return entry[1]
+
+    response = requests.get(url)
+
+    # Only cache successful responses so errors are retried on the next call
+    if response.status_code == 200:
+        with _lock:
+            _cache[url] = (now + TMDB_CACHE_TTL, response)
+            _cache.move_to_end(url)
+            while len(_cache) > TMDB_CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    return response
@@ -4,7 +4,8 @@ from auth_helpers import verify_token
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import os
-import requests
+from tmdb_cache import cached_get
+import prefetch
 import random
 
 router = APIRouter()
@@ -24,7 +25,7 @@ TMDB_BASE_URL = "https://api.themoviedb.org/3"
 def get_movie_details(movie_id: int):
     """Fetch movie details (title, poster) from TMDB API"""
     url = f"https://api.themoviedb.org/3/movie/{movie_id}?api_key={TMDB_API_KEY}"
-    response = requests.get(url)
+    response = cached_get(url)
     if response.status_code == 200:
         data = response.json()
         return {
@@ -70,6 +71,9 @@ def add_to_watchlist(request: WatchlistRequest):
     conn.commit()
 
     conn.close()
+
+    # Warm the cache for the reads that usually follow
+    prefetch.publish_movie_touched(request.user_id, request.movie_id)
     
     return {"message": "Movie added to watchlist", "title": movie_details["title"]}
 
@@ -122,6 +126,9 @@ def add_to_watched(movie: Movie, user_email: str = Depends(verify_token)):
 
     db.close()
 
+    # Warm the cache for the reads that usually follow
+    prefetch.publish_movie_touched(user_id, movie.movie_id)
+
     return {"message": "Movie added to watched list"}
 
 # Remove movie from watched list
@@ -230,7 +237,7 @@ def get_recommendations(user_email: str = Depends(verify_token)):
 
         # Step 3: Get TMDB Genre IDs
         genre_mapping_url = f"{TMDB_BASE_URL}/genre/movie/list?api_key={TMDB_API_KEY}"
-        response = requests.get(genre_mapping_url)
+        response = cached_get(genre_mapping_url)
         if response.status_code != 200:
             return {"recommendations": []}
 
@@ -247,7 +254,7 @@ def get_recommendations(user_email: str = Depends(verify_token)):
         recommended_movies = {}
         for genre_id in user_genre_ids:
             tmdb_url = f"{TMDB_BASE_URL}/discover/movie?api_key={TMDB_API_KEY}&with_genres={genre_id}"
-            response = requests.get(tmdb_url)
+            response = cached_get(tmdb_url)
             if response.status_code == 200:
                 movies = response.json().get("results", [])
                 random.shuffle(movies)  # Shuffle movies to randomize the order